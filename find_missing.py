@@ -4,12 +4,11 @@ import sys
 import pandas as pd
 import datetime
 import asyncio
-import re
 import json
 from dotenv import load_dotenv
 from src.attendee_manager import AttendeeManager
 from src.name_matcher import NameMatcher
-from src.group_matcher import GroupMatcher
+from src.group_matcher import GroupMatcher, GROUP_CODE_RE
 
 # Load environment variables
 load_dotenv()
@@ -90,7 +89,7 @@ async def get_discord_members(guild_id, token):
                         # Extract cat-x-grp-y pattern from roles
                         group_code = ""
                         for role_name in role_names:
-                            match = re.search(r'(cat-\d+-grp-\d+)', role_name)
+                            match = GROUP_CODE_RE.search(role_name)
                             if match:
                                 group_code = match.group(1)
                                 break
@@ -233,15 +232,19 @@ async def check_attendance(csv_path=None, similarity_threshold=80, use_group_mat
             matcher = NameMatcher(similarity_threshold=similarity_threshold)
             missing_attendees_names = matcher.find_missing_attendees(member_names, attendee_names)
             
+            # Map each attendee name to its attendee (the first one if names repeat)
+            attendee_by_name = {}
+            for attendee in attendees:
+                attendee_by_name.setdefault(attendee['name'], attendee)
+            
             # Structure missing attendees by group
             missing_by_group = {}
             for name in missing_attendees_names:
                 # Find the attendee's group
-                group = next((a['group'] for a in attendees if a['name'] == name), "Unknown")
+                attendee = attendee_by_name.get(name)
+                group = attendee['group'] if attendee else "Unknown"
                 
-                if group not in missing_by_group:
-                    missing_by_group[group] = []
-                missing_by_group[group].append(name)
+                missing_by_group.setdefault(group, []).append(name)
             
             # Save text report
             txt_filename = f"output/missing_attendees_{timestamp}.txt"
@@ -276,7 +279,7 @@ async def check_attendance(csv_path=None, similarity_threshold=80, use_group_mat
             if missing_attendees_names:
                 missing_data = []
                 for name in missing_attendees_names:
-                    attendee = next((a for a in attendees if a['name'] == name), None)
+                    attendee = attendee_by_name.get(name)
                     if attendee:
                         missing_data.append({
                             'ID': attendee.get('id', ''),
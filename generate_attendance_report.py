@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 import os
 import csv
-import re
 import pandas as pd
 from datetime import datetime
+from src.group_matcher import GROUP_CODE_RE
 
 # Script to generate a report of all attendees with their Discord status
 
+# Punctuation, slashes included, that normalize_name turns into spaces
+SPECIAL_CHARS_TABLE = str.maketrans({char: ' ' for char in '.,-_()[]{}:;/\\'})
+
 def extract_group_code(role_text):
     """Extract cat-x-grp-y pattern from Discord role info."""
     if not role_text:
         return ""
     
-    match = re.search(r'(cat-\d+-grp-\d+)', role_text)
+    match = GROUP_CODE_RE.search(role_text)
     if match:
         return match.group(1)
     return ""
@@ -87,8 +90,7 @@ def normalize_name(name):
     normalized = name.lower()
     
     # Remove special characters
-    for char in ['.', ',', '-', '_', '(', ')', '[', ']', '{', '}', ':', ';', '/', '\\']:
-        normalized = normalized.replace(char, ' ')
+    normalized = normalized.translate(SPECIAL_CHARS_TABLE)
     
     # Trim and remove consecutive spaces
     normalized = ' '.join(normalized.split())
@@ -1,20 +1,24 @@
 #!/usr/bin/env python3
 import os
 import csv
-import re
 import pandas as pd
 from datetime import datetime
 from difflib import SequenceMatcher
+from src.group_matcher import GROUP_CODE_RE
 
 # Script to generate a report of all attendees with their Discord status
 # Version 2: Improved matching algorithm using group codes and fuzzy name matching
 
+# Punctuation that normalize_name turns into spaces. '/' is not in it, since
+# normalize_name keeps only the part after a "Group / Person" slash.
+SPECIAL_CHARS_TABLE = str.maketrans({char: ' ' for char in '.,-_()[]{}:;\\'})
+
 def extract_group_code(role_text):
     """Extract cat-x-grp-y pattern from Discord role info."""
     if not role_text:
         return ""
     
-    match = re.search(r'(cat-\d+-grp-\d+)', role_text)
+    match = GROUP_CODE_RE.search(role_text)
     if match:
         return match.group(1)
     return ""
@@ -49,9 +53,7 @@ def load_discord_members(discord_file):
                     
                     # Store by group code
                     if group_code:
-                        if group_code not in discord_members:
-                            discord_members[group_code] = []
-                        discord_members[group_code].append(member)
+                        discord_members.setdefault(group_code, []).append(member)
                     
                     # Store in all members list
                     all_members.append(member)
@@ -107,25 +109,26 @@ def normalize_name(name):
         return ""
     
     # Extract name after slash if present (for "Group Name / Person Name" format)
-    if '/' in name:
-        parts = name.split('/')
-        if len(parts) > 1 and len(parts[1].strip()) > 0:
-            name = parts[1].strip()
+    after_slash = name.partition('/')[2].partition('/')[0].strip()
+    if after_slash:
+        name = after_slash
     
     # Convert to lowercase
     normalized = name.lower()
     
     # Remove special characters
-    for char in ['.', ',', '-', '_', '(', ')', '[', ']', '{', '}', ':', ';', '\\']:
-        normalized = normalized.replace(char, ' ')
+    normalized = normalized.translate(SPECIAL_CHARS_TABLE)
     
     # Trim and remove consecutive spaces
     normalized = ' '.join(normalized.split())
     
     return normalized
 
-def name_similarity(name1, name2):
-    """Calculate similarity between two names using sequence matcher."""
+def name_similarity(name1, name2, cutoff=0.0):
+    """
+    Calculate similarity between two names using sequence matcher.
+    Scores that cannot beat cutoff may be returned as 0.0 without running the full comparison.
+    """
     # First check if either name contains the other
     if name1 in name2 or name2 in name1:
         return 0.9  # High similarity score for contained names
@@ -139,8 +142,12 @@ def name_similarity(name1, name2):
         if len(word1) > 2 and word1 in words2:  # Only consider words > 2 chars
             return 0.8  # Good similarity for matching words
     
-    # Use sequence matcher for more detailed comparison
-    return SequenceMatcher(None, name1, name2).ratio()
+    # Use sequence matcher for more detailed comparison, skipping it when
+    # its cheap upper bounds already rule out beating the cutoff
+    matcher = SequenceMatcher(None, name1, name2)
+    if matcher.real_quick_ratio() <= cutoff or matcher.quick_ratio() <= cutoff:
+        return 0.0
+    return matcher.ratio()
 
 def find_discord_match(attendee, discord_members_by_group, all_discord_members):
     """Find a matching Discord member for an attendee using multiple strategies."""
@@ -153,7 +160,7 @@ def find_discord_match(attendee, discord_members_by_group, all_discord_members):
         
         # Look for name matches within the group
         for member in group_members:
-            similarity = name_similarity(attendee['normalized_name'], member['normalized_name'])
+            similarity = name_similarity(attendee['normalized_name'], member['normalized_name'], best_score)
             
             # If very high similarity in the same group, return immediately
             if similarity > 0.8:
@@ -170,7 +177,7 @@ def find_discord_match(attendee, discord_members_by_group, all_discord_members):
     
     # Strategy 2: Look across all members for high-similarity matches
     for member in all_discord_members:
-        similarity = name_similarity(attendee['normalized_name'], member['normalized_name'])
+        similarity = name_similarity(attendee['normalized_name'], member['normalized_name'], best_score)
         
         if similarity > best_score:
             best_score = similarity
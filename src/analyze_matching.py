@@ -18,6 +18,7 @@ Options:
 import os
 import sys
 import csv
+import heapq
 import argparse
 import pandas as pd
 from datetime import datetime
@@ -76,12 +77,12 @@ def load_attendees(filename=None):
     try:
         # Try to read as CSV
         attendees = []
-        df = pd.read_csv(filename)
+        column_count = len(pd.read_csv(filename, nrows=0).columns)
         
-        # Assume name is in the second column (index 1)
-        if len(df.columns) >= 2:
-            name_col = df.iloc[:, 1]
-            for _, name in name_col.items():
+        # Assume name is in the second column (index 1), and only parse that column
+        if column_count >= 2:
+            name_col = pd.read_csv(filename, usecols=[1], engine='c').iloc[:, 0]
+            for name in name_col:
                 if pd.notna(name) and isinstance(name, str) and name.strip():
                     attendees.append(name.strip())
         
@@ -128,9 +129,9 @@ def find_edge_cases(matcher, discord_users, attendee_names, threshold=80, n=10):
         if best_score < threshold * 0.8 and best_discord:  # Names with very low match scores
             edge_cases.append((100, attendee, best_discord, best_score, best_details))
     
-    # Sort by closeness to threshold and take top N
-    edge_cases.sort()
-    return edge_cases[:n]
+    # Take the N closest to the threshold without sorting them all. The key leaves out
+    # the details dict, which cannot be compared when two cases otherwise tie.
+    return heapq.nsmallest(n, edge_cases, key=lambda case: case[:4])
 
 def analyze_group_format(attendee_names):
     """
@@ -1,8 +1,70 @@
+import io
 import os
+import sys
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
+# Names given to the CSV columns that are read (see _read_attendee_columns)
+_COLUMNS = ['id', 'name', 'email', 'phone', 'group']
+
+@lru_cache(maxsize=8)
+def _read_attendee_columns(data: bytes) -> Tuple[int, Optional[Tuple[np.ndarray, ...]]]:
+    """
+    Parse the attendee CSV into column arrays.
+    Cached on the file contents themselves, so reloading an unchanged file skips parsing
+    and a rewritten file is always parsed again, whatever its size and timestamps.
+    
+    Args:
+        data (bytes): Contents of the attendee CSV file
+        
+    Returns:
+        Tuple[int, Optional[Tuple[np.ndarray, ...]]]: Column count of the file, and the
+        (ids, names, emails, phones, groups) arrays, or None if the file has too few columns
+    """
+    # Validate that the necessary columns exist
+    column_count = len(pd.read_csv(io.BytesIO(data), nrows=0).columns)
+    if column_count < 12:
+        return column_count, None
+    
+    # Read only the columns we use, with their types given up front:
+    # - ID from column 1 (index 0)
+    # - Name from column 2 (index 1)
+    # - Email from column 3 (index 2)
+    # - Phone from column 4 (index 3)
+    # - Group info from column 12 (index 11)
+    df = pd.read_csv(
+        io.BytesIO(data),
+        usecols=[0, 1, 2, 3, 11],
+        names=_COLUMNS,
+        header=0,
+        dtype={column: 'string' for column in _COLUMNS},
+        engine='c'
+    )
+    id_col = df['id']
+    name_col = df['name']
+    email_col = df['email']
+    phone_col = df['phone']
+    group_col = df['group']
+    
+    # Keep only rows with a non-empty name
+    valid = name_col.str.strip().fillna('').ne('').to_numpy(dtype=bool)
+    
+    def column_values(col, default):
+        values = col[valid]
+        return values.fillna(default).to_numpy(dtype=object)
+    
+    ids = column_values(id_col, "")
+    names = np.array([name.strip() for name in column_values(name_col, "")], dtype=object)
+    emails = column_values(email_col, "")
+    phones = column_values(phone_col, "")
+    # Group names repeat across many rows, so intern them to share one string per group
+    groups = np.array([sys.intern(group.strip()) for group in column_values(group_col, "Unassigned")], dtype=object)
+    
+    return column_count, (ids, names, emails, phones, groups)
+
 class AttendeeManager:
     """
     Manages attendee information from a CSV file.
@@ -23,7 +85,13 @@ class AttendeeManager:
         if not self.file_path:
             raise ValueError("No attendee list file path provided. Please set ATTENDEE_LIST_PATH in .env or provide it directly.")
         
-        self.attendees = []
+        # Attendee fields are stored column-wise as parallel arrays
+        self._ids = np.empty(0, dtype=object)
+        self._names = np.empty(0, dtype=object)
+        self._emails = np.empty(0, dtype=object)
+        self._phones = np.empty(0, dtype=object)
+        self._groups = np.empty(0, dtype=object)
+        self._name_index = {}  # Attendee name -> row in the arrays above
         self.groups = {}
         
     def load_attendees(self) -> bool:
@@ -34,62 +102,40 @@ class AttendeeManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Attempt to read the CSV file
-            df = pd.read_csv(self.file_path)
-            
-            # Validate that the necessary columns exist
-            if len(df.columns) < 12:
-                print(f"CSV file does not have enough columns. Found {len(df.columns)}, expected at least 12.")
+            # Reuse the parsed columns while the file contents are unchanged
+            with open(self.file_path, 'rb') as f:
+                column_count, columns = _read_attendee_columns(f.read())
+            if columns is None:
+                print(f"CSV file does not have enough columns. Found {column_count}, expected at least 12.")
                 return False
             
-            # Extract information from columns:
-            # - ID from column 1 (index 0)
-            # - Name from column 2 (index 1)
-            # - Email from column 3 (index 2)
-            # - Phone from column 4 (index 3)
-            # - Group info from column 12 (index 11)
-            id_col = df.iloc[:, 0] if len(df.columns) > 0 else None
-            name_col = df.iloc[:, 1] if len(df.columns) > 1 else None
-            email_col = df.iloc[:, 2] if len(df.columns) > 2 else None
-            phone_col = df.iloc[:, 3] if len(df.columns) > 3 else None
-            group_col = df.iloc[:, 11] if len(df.columns) > 11 else None
-            
-            # Validate essential columns
-            if name_col is None:
-                print("CSV file missing name column (column 2)")
-                return False
+            # The cached arrays are shared between managers and never modified in place
+            self._ids, self._names, self._emails, self._phones, self._groups = columns
             
-            # Store attendees with their groups
-            for index, name in name_col.items():
-                if pd.notna(name) and isinstance(name, str) and name.strip():
-                    # Get attendee data from different columns
-                    attendee_id = str(id_col.iloc[index]) if id_col is not None and pd.notna(id_col.iloc[index]) else ""
-                    email = str(email_col.iloc[index]) if email_col is not None and pd.notna(email_col.iloc[index]) else ""
-                    phone = str(phone_col.iloc[index]) if phone_col is not None and pd.notna(phone_col.iloc[index]) else ""
-                    group = str(group_col.iloc[index]) if group_col is not None and pd.notna(group_col.iloc[index]) else "Unassigned"
-                    group = group.strip()
-                    
-                    # Add to attendee list
-                    self.attendees.append({
-                        'id': attendee_id,
-                        'name': name.strip(),
-                        'email': email,
-                        'phone': phone,
-                        'group': group
-                    })
-                    
-                    # Update group dictionary
-                    if group not in self.groups:
-                        self.groups[group] = []
-                    self.groups[group].append(name.strip())
+            # Build lookup structures
+            self._name_index = {}
+            self.groups = {}
+            for i, (name, group) in enumerate(zip(self._names, self._groups)):
+                self._name_index.setdefault(name, i)
+                self.groups.setdefault(group, []).append(name)
             
-            print(f"Successfully loaded {len(self.attendees)} attendees from {self.file_path}")
+            print(f"Successfully loaded {len(self._names)} attendees from {self.file_path}")
             return True
             
         except Exception as e:
             print(f"Error loading attendees: {str(e)}")
             return False
     
+    @property
+    def attendees(self) -> List[Dict[str, str]]:
+        """
+        List of all attendees, as an attribute for existing callers (read-only).
+        
+        Returns:
+            List[Dict[str, str]]: Same attendee dictionaries as get_attendees
+        """
+        return self.get_attendees()
+    
     def get_attendees(self) -> List[Dict[str, str]]:
         """
         Get the list of all attendees.
@@ -97,7 +143,11 @@ class AttendeeManager:
         Returns:
             List[Dict[str, str]]: List of attendee dictionaries with 'name' and 'group' keys
         """
-        return self.attendees
+        return [
+            {'id': attendee_id, 'name': name, 'email': email, 'phone': phone, 'group': group}
+            for attendee_id, name, email, phone, group
+            in zip(self._ids, self._names, self._emails, self._phones, self._groups)
+        ]
     
     def get_attendee_names(self) -> List[str]:
         """
@@ -106,7 +156,21 @@ class AttendeeManager:
         Returns:
             List[str]: List of attendee names
         """
-        return [attendee['name'] for attendee in self.attendees]
+        return self._names.tolist()
+    
+    def get_attendee_group(self, name: str, default: Optional[str] = "Unknown") -> Optional[str]:
+        """
+        Get the group of an attendee by name.
+        
+        Args:
+            name (str): Name of the attendee
+            default (Optional[str]): Value returned if the attendee is not found
+            
+        Returns:
+            Optional[str]: Group of the attendee, or the default if not found
+        """
+        index = self._name_index.get(name)
+        return self._groups[index] if index is not None else default
     
     def get_groups(self) -> Dict[str, List[str]]:
         """
@@ -133,7 +197,7 @@ class AttendeeManager:
 if __name__ == "__main__":
     manager = AttendeeManager()
     if manager.load_attendees():
-        print(f"Total attendees: {len(manager.get_attendees())}")
+        print(f"Total attendees: {len(manager.get_attendee_names())}")
         print(f"Total groups: {len(manager.get_groups())}")
         
         # Print first 5 attendees as example
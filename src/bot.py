@@ -1,4 +1,6 @@
 import os
+import re
+import asyncio
 import discord
 import pandas as pd
 from discord.ext import commands
@@ -20,6 +22,58 @@ intents.message_content = True
 
 bot = commands.Bot(command_prefix='!', intents=intents)
 
+# Symbols and emoji that carry no name information. Separators that
+# NameMatcher.normalize_name interprets ('.', '_', '-', '#', '/', brackets, ...)
+# are kept so its normalization still applies.
+_CLEAN_NAME_RE = re.compile(r"[^\w\s.,\-()\[\]{}:;#/]+")
+
+def clean_name(name: str) -> str:
+    """
+    Strip emoji and decorative symbols from a name before matching.
+    Names made up only of symbols are returned unchanged, since an empty name
+    would match every other empty name.
+    
+    Args:
+        name (str): Discord member or attendee name
+        
+    Returns:
+        str: Lowercased name without decorative symbols, or the original name
+        if nothing else is left
+    """
+    return _CLEAN_NAME_RE.sub('', name).lower().strip() or name
+
+def find_missing_attendee_names(matcher: NameMatcher, member_names: List[str],
+                                attendee_names: List[str]) -> List[str]:
+    """
+    Find missing attendees, cleaning all names once before matching.
+    
+    Args:
+        matcher (NameMatcher): Matcher to use
+        member_names (List[str]): Discord member names
+        attendee_names (List[str]): Attendee names from the CSV
+        
+    Returns:
+        List[str]: Original attendee names that were not found in Discord
+    """
+    member_clean = list(map(clean_name, member_names))
+    attendee_clean = list(map(clean_name, attendee_names))
+    missing_clean = set(matcher.find_missing_attendees(member_clean, attendee_clean))
+    return [name for name, clean in zip(attendee_names, attendee_clean) if clean in missing_clean]
+
+def load_attendee_manager(file_path: Optional[str] = None) -> Optional[AttendeeManager]:
+    """
+    Create an AttendeeManager and load its attendee list.
+    This does blocking file I/O, so commands run it via asyncio.to_thread.
+    
+    Args:
+        file_path (Optional[str]): Path to the attendee list CSV (overrides .env setting)
+        
+    Returns:
+        Optional[AttendeeManager]: The loaded manager, or None if loading failed
+    """
+    manager = AttendeeManager(file_path)
+    return manager if manager.load_attendees() else None
+
 @bot.event
 async def on_ready():
     print(f'{bot.user.name} has connected to Discord!')
@@ -47,13 +101,12 @@ async def check_attendance(ctx, file_path: Optional[str] = None, threshold: Opti
         return
     
     try:
-        # Load attendees
-        manager = AttendeeManager(file_path)
-        if not manager.load_attendees():
+        # Load attendees off the event loop
+        manager = await asyncio.to_thread(load_attendee_manager, file_path)
+        if manager is None:
             await processing_msg.edit(content="❌ Failed to load attendee list. Check the file path and format.")
             return
         
-        attendees = manager.get_attendees()
         attendee_names = manager.get_attendee_names()
         groups = manager.get_groups()
         
@@ -63,17 +116,17 @@ async def check_attendance(ctx, file_path: Optional[str] = None, threshold: Opti
         
         # Match names
         matcher = NameMatcher(similarity_threshold=threshold)
-        missing_attendees_names = matcher.find_missing_attendees(member_names, attendee_names)
+        missing_attendees_names = await asyncio.to_thread(
+            find_missing_attendee_names, matcher, member_names, attendee_names
+        )
         
         # Structure missing attendees by group
         missing_by_group = {}
         for name in missing_attendees_names:
             # Find the attendee's group
-            group = next((a['group'] for a in attendees if a['name'] == name), "Unknown")
+            group = manager.get_attendee_group(name)
             
-            if group not in missing_by_group:
-                missing_by_group[group] = []
-            missing_by_group[group].append(name)
+            missing_by_group.setdefault(group, []).append(name)
         
         # Generate report
         if not missing_attendees_names:
@@ -101,14 +154,15 @@ async def check_attendance(ctx, file_path: Optional[str] = None, threshold: Opti
                 await ctx.send(f"📑 Report Part {i+1}/{len(chunks)}:\n{chunk}")
         
         # Save report to file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"attendance_report_{timestamp}.txt"
         with open(filename, 'w', encoding='utf-8') as f:
             # Write summary
-            f.write(f"Attendance Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Attendance Report - {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Server: {guild.name} (ID: {guild.id})\n")
             f.write(f"Total Discord Members: {len(members)}\n")
-            f.write(f"Total Attendees: {len(attendees)}\n")
+            f.write(f"Total Attendees: {len(attendee_names)}\n")
             f.write(f"Missing Attendees: {len(missing_attendees_names)}\n\n")
             
             # Write detailed report
@@ -138,13 +192,12 @@ async def export_missing(ctx, file_path: Optional[str] = None, threshold: Option
         return
     
     try:
-        # Load attendees
-        manager = AttendeeManager(file_path)
-        if not manager.load_attendees():
+        # Load attendees off the event loop
+        manager = await asyncio.to_thread(load_attendee_manager, file_path)
+        if manager is None:
             await processing_msg.edit(content="❌ Failed to load attendee list. Check the file path and format.")
             return
         
-        attendees = manager.get_attendees()
         attendee_names = manager.get_attendee_names()
         
         # Get Discord members
@@ -153,17 +206,19 @@ async def export_missing(ctx, file_path: Optional[str] = None, threshold: Option
         
         # Match names
         matcher = NameMatcher(similarity_threshold=threshold)
-        missing_attendees_names = matcher.find_missing_attendees(member_names, attendee_names)
+        missing_attendees_names = await asyncio.to_thread(
+            find_missing_attendee_names, matcher, member_names, attendee_names
+        )
         
         # Create dataframe for the missing attendees
         missing_data = []
         for name in missing_attendees_names:
-            # Find the complete attendee record
-            attendee = next((a for a in attendees if a['name'] == name), None)
-            if attendee:
+            # Find the attendee's group
+            group = manager.get_attendee_group(name, default=None)
+            if group is not None:
                 missing_data.append({
                     'Name': name,
-                    'Group': attendee['group']
+                    'Group': group
                 })
         
         # Create Excel file
@@ -171,7 +226,7 @@ async def export_missing(ctx, file_path: Optional[str] = None, threshold: Option
             df = pd.DataFrame(missing_data)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"missing_attendees_{timestamp}.xlsx"
-            df.to_excel(filename, index=False)
+            await asyncio.to_thread(df.to_excel, filename, index=False)
             
             await processing_msg.edit(content=f"✅ Export completed! {len(missing_data)} missing attendees saved to `{filename}`")
         else:
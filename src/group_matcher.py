@@ -1,9 +1,17 @@
+import os
 import re
 import csv
-import pandas as pd
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Set, Any
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process
 from datetime import datetime
+from functools import lru_cache
+from openpyxl import Workbook
+from src.name_matcher import _normalize_impl
+
+# Discord group codes look like cat-x-grp-y
+GROUP_CODE_RE = re.compile(r'(cat-\d+-grp-\d+)')
+_GROUP_PARTS_RE = re.compile(r'cat-(\d+)-grp-(\d+)')
 
 class GroupMatcher:
     """
@@ -22,25 +30,36 @@ class GroupMatcher:
         self.threshold = similarity_threshold
         self.debug = debug
         self.debug_file = None
+        self._debug_fh = None  # Open handle to debug_file while debugging
     
     def set_debug(self, debug: bool, debug_file: Optional[str] = None):
         """Set debug mode and optionally specify a debug file."""
+        self.close()
         self.debug = debug
         self.debug_file = debug_file
         
         if debug and debug_file:
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(f"Group Matcher Debug Log - {datetime.now()}\n")
-                f.write(f"Similarity threshold: {self.threshold}\n")
-                f.write("-" * 80 + "\n\n")
+            # Keep the file open (line buffered) instead of reopening it per message
+            self._debug_fh = open(debug_file, 'w', encoding='utf-8', buffering=1)
+            self._debug_fh.write(f"Group Matcher Debug Log - {datetime.now()}\n")
+            self._debug_fh.write(f"Similarity threshold: {self.threshold}\n")
+            self._debug_fh.write("-" * 80 + "\n\n")
+    
+    def close(self):
+        """Close the debug file, if one is open."""
+        if self._debug_fh is not None:
+            self._debug_fh.close()
+            self._debug_fh = None
+    
+    def __del__(self):
+        self.close()
     
     def _debug_print(self, message: str):
         """Print debug message if debug mode is enabled."""
         if self.debug:
             print(message)
-            if self.debug_file:
-                with open(self.debug_file, 'a', encoding='utf-8') as f:
-                    f.write(message + "\n")
+            if self._debug_fh is not None:
+                self._debug_fh.write(message + "\n")
     
     def normalize_name(self, name: str) -> str:
         """
@@ -55,26 +74,8 @@ class GroupMatcher:
         if not name:
             return ""
         
-        # Extract name after slash if present
-        if '/' in name:
-            parts = name.split('/')
-            if len(parts) > 1 and len(parts[1].strip()) > 0:
-                name = parts[1].strip()
-        
-        # Convert to lowercase
-        normalized = name.lower()
-        
-        # Remove Discord discriminators
-        if '#' in normalized:
-            normalized = normalized.split('#')[0]
-        
-        # Remove special characters
-        for char in ['.', ',', '-', '_', '(', ')', '[', ']', '{', '}', ':', ';']:
-            normalized = normalized.replace(char, ' ')
-        
-        # Trim and remove consecutive spaces
-        normalized = ' '.join(normalized.split())
-        
+        # Same normalization as NameMatcher, sharing its cache
+        normalized, _ = _normalize_impl(name)
         return normalized
     
     def extract_group_code(self, column_value: str) -> str:
@@ -89,7 +90,7 @@ class GroupMatcher:
         """
         # Direct match for cat-x-grp-y format
         if isinstance(column_value, str):
-            match = re.search(r'(cat-\d+-grp-\d+)', column_value)
+            match = GROUP_CODE_RE.search(column_value)
             if match:
                 return match.group(1)
         
@@ -111,29 +112,25 @@ class GroupMatcher:
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 for line in f:
-                    parts = line.strip().split('|')
-                    if len(parts) >= 5:  # ID|DisplayName|Username|Nickname|Group|Roles
-                        discord_id = parts[0]
-                        display_name = parts[1]
-                        username = parts[2]
-                        nickname = parts[3] if len(parts) > 3 and parts[3] else ""
-                        group_code = parts[4] if len(parts) > 4 and parts[4] else ""
-                        
-                        # Store member details
-                        discord_members[discord_id] = {
-                            'id': discord_id,
-                            'display_name': display_name,
-                            'username': username,
-                            'nickname': nickname,
-                            'group_code': group_code,
-                            'normalized_name': self.normalize_name(display_name)
-                        }
-                        
-                        # Organize by group
-                        if group_code:
-                            if group_code not in group_members:
-                                group_members[group_code] = []
-                            group_members[group_code].append(discord_id)
+                    # ID|DisplayName|Username|Nickname|Group|Roles (roles are not split further)
+                    parts = line.rstrip('\r\n').split('|', 5)
+                    if len(parts) < 5:
+                        continue
+                    discord_id, display_name, username, nickname, group_code = parts[:5]
+                    
+                    # Store member details
+                    discord_members[discord_id] = {
+                        'id': discord_id,
+                        'display_name': display_name,
+                        'username': username,
+                        'nickname': nickname,
+                        'group_code': group_code,
+                        'normalized_name': self.normalize_name(display_name)
+                    }
+                    
+                    # Organize by group
+                    if group_code:
+                        group_members.setdefault(group_code, []).append(discord_id)
             
             if self.debug:
                 self._debug_print(f"Loaded {len(discord_members)} Discord members from {filepath}")
@@ -160,44 +157,40 @@ class GroupMatcher:
         group_attendees = {}  # Attendees organized by group
         
         try:
-            # Read the CSV file
-            df = pd.read_csv(filepath)
-            
-            # Get the column names to find the right columns
-            col_names = df.columns.tolist()
-            
-            # Find the relevant columns
-            # Assume ID is in the first column (index 0)
-            id_col = df.iloc[:, 0] if len(df.columns) > 0 else None
-            
-            # Assume name is in the second column (index 1)
-            name_col = df.iloc[:, 1] if len(df.columns) > 1 else None
-            
-            # Assume email is in the third column (index 2)
-            email_col = df.iloc[:, 2] if len(df.columns) > 2 else None
-            
-            # Assume phone is in the fourth column (index 3)
-            phone_col = df.iloc[:, 3] if len(df.columns) > 3 else None
-            
-            # Assume group is in column 12 (index 11)
-            group_col = df.iloc[:, 11] if len(df.columns) > 11 else None
-            
-            if name_col is None:
-                if self.debug:
-                    self._debug_print("Error: Could not find name column in CSV")
-                return {}, {}
-            
-            # Process each attendee
-            for i, name in name_col.items():
-                if pd.notna(name) and isinstance(name, str) and name.strip():
+            with open(filepath, 'r', newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                headers = next(reader, [])
+                
+                # Columns used (by position):
+                # - ID in the first column (index 0)
+                # - Name in the second column (index 1)
+                # - Email in the third column (index 2)
+                # - Phone in the fourth column (index 3)
+                # - Group in column 12 (index 11)
+                if len(headers) < 2:
+                    if self.debug:
+                        self._debug_print("Error: Could not find name column in CSV")
+                    return {}, {}
+                
+                def column(row: List[str], index: int) -> str:
+                    return row[index] if index < len(headers) and index < len(row) else ""
+                
+                # Process each attendee (i counts data rows, skipping blank lines)
+                i = -1
+                for row in reader:
+                    if not row:
+                        continue
+                    i += 1
+                    
+                    name = column(row, 1)
+                    if not name.strip():
+                        continue
+                    
                     # Extract attendee information
-                    attendee_record_id = str(id_col.iloc[i]) if id_col is not None and pd.notna(id_col.iloc[i]) else ""
-                    email = str(email_col.iloc[i]) if email_col is not None and pd.notna(email_col.iloc[i]) else ""
-                    phone = str(phone_col.iloc[i]) if phone_col is not None and pd.notna(phone_col.iloc[i]) else ""
-                    group = ""
-                    if group_col is not None and i < len(group_col):
-                        if pd.notna(group_col.iloc[i]):
-                            group = str(group_col.iloc[i]).strip()
+                    attendee_record_id = column(row, 0)
+                    email = column(row, 2)
+                    phone = column(row, 3)
+                    group = column(row, 11).strip()
                     
                     # Create a clean unique ID for the attendee
                     attendee_id = f"a{i}"
@@ -217,9 +210,7 @@ class GroupMatcher:
                     
                     # Organize by group
                     if group:
-                        if group not in group_attendees:
-                            group_attendees[group] = []
-                        group_attendees[group].append(attendee_id)
+                        group_attendees.setdefault(group, []).append(attendee_id)
             
             if self.debug:
                 self._debug_print(f"Loaded {len(attendees)} attendees from {filepath}")
@@ -246,34 +237,56 @@ class GroupMatcher:
         """
         group_mapping = {}
         
+        # Lowercase the attendee group names once for all Discord groups
+        attendee_groups_lower = [(group, group.lower()) for group in attendee_groups.keys()]
+        
+        # Fuzzy similarity of every Discord/attendee group name pair, computed in one batch.
+        # It only breaks ties between attendee groups with the same pattern score below.
+        discord_groups_lower = [discord_group.lower() for discord_group in discord_groups.keys()]
+        if discord_groups_lower and attendee_groups_lower:
+            fuzzy_scores = process.cdist(
+                discord_groups_lower,
+                [group_lower for _, group_lower in attendee_groups_lower],
+                scorer=fuzz.partial_ratio,
+                dtype=np.uint8,
+                workers=-1
+            )
+        else:
+            fuzzy_scores = np.zeros((len(discord_groups_lower), len(attendee_groups_lower)), dtype=np.uint8)
+        
         # Find the likely match for each Discord group
-        for discord_group, members in discord_groups.items():
+        for row, (discord_group, members) in enumerate(discord_groups.items()):
             best_match = None
             best_score = 0
+            best_fuzzy_score = 0
             
             # Extract the group number from cat-x-grp-y format
-            group_match = re.search(r'cat-(\d+)-grp-(\d+)', discord_group)
+            group_match = _GROUP_PARTS_RE.search(discord_group)
             if group_match:
                 category_num = group_match.group(1)
                 group_num = group_match.group(2)
                 
+                # Build the patterns for this Discord group once
+                discord_group_lower = discord_groups_lower[row]
+                grp_pattern = f"grp-{group_num}"
+                group_pattern = f"group {group_num}"
+                team_pattern = f"team {group_num}"
+                suffix_pattern = f" {group_num}"
+                
                 # Look for similar patterns in attendee groups
-                for attendee_group in attendee_groups.keys():
-                    # Check for exact or partial matches
-                    attendee_group_lower = attendee_group.lower()
-                    
+                for col, (attendee_group, attendee_group_lower) in enumerate(attendee_groups_lower):
                     # Check for common patterns:
                     # 1. Exact "cat-x-grp-y" in attendee group
-                    if discord_group.lower() in attendee_group_lower:
+                    if discord_group_lower in attendee_group_lower:
                         score = 100
                     # 2. Just the "grp-y" part 
-                    elif f"grp-{group_num}" in attendee_group_lower:
+                    elif grp_pattern in attendee_group_lower:
                         score = 90
                     # 3. Just the number
-                    elif f"group {group_num}" in attendee_group_lower or f"team {group_num}" in attendee_group_lower:
+                    elif group_pattern in attendee_group_lower or team_pattern in attendee_group_lower:
                         score = 85
                     # 4. Group number at the end
-                    elif attendee_group_lower.endswith(f" {group_num}"):
+                    elif attendee_group_lower.endswith(suffix_pattern):
                         score = 80
                     # 5. Fall back to if the numbers match somewhere
                     elif group_num in attendee_group_lower:
@@ -281,9 +294,18 @@ class GroupMatcher:
                     else:
                         score = 0
                     
-                    if score > best_score:
+                    if score == 0:
+                        continue
+                    
+                    fuzzy_score = fuzzy_scores[row, col]
+                    if (score, fuzzy_score) > (best_score, best_fuzzy_score):
                         best_score = score
+                        best_fuzzy_score = fuzzy_score
                         best_match = attendee_group
+                        
+                        # Nothing can beat an exact match on both scores
+                        if best_score == 100 and best_fuzzy_score == 100:
+                            break
             
             if best_match:
                 group_mapping[discord_group] = best_match
@@ -292,13 +314,35 @@ class GroupMatcher:
         
         return group_mapping
     
-    def match_by_name(self, discord_name: str, attendee_names: List[str]) -> Tuple[Optional[str], int]:
+    def build_exact_index(self, norm_names: List[str]) -> Dict[str, int]:
+        """
+        Index normalized names for constant-time exact match lookups.
+        
+        Args:
+            norm_names (List[str]): Normalized names
+            
+        Returns:
+            Dict[str, int]: Normalized name -> index of its first occurrence
+        """
+        exact_index = {}
+        for i, norm_name in enumerate(norm_names):
+            exact_index.setdefault(norm_name, i)
+        return exact_index
+    
+    def match_by_name(self, discord_name: str, attendee_names: List[str],
+                      norm_attendees: Optional[List[str]] = None,
+                      norm_discord: Optional[str] = None,
+                      exact_index: Optional[Dict[str, int]] = None) -> Tuple[Optional[str], int]:
         """
         Find the best name match from a list of names.
         
         Args:
             discord_name (str): Discord name to match
             attendee_names (List[str]): List of attendee names to match against
+            norm_attendees (Optional[List[str]]): Normalized attendee names, parallel to attendee_names
+            norm_discord (Optional[str]): Normalized Discord name
+            exact_index (Optional[Dict[str, int]]): Normalized attendee name -> first index
+                in attendee_names, as built by build_exact_index
             
         Returns:
             Tuple[Optional[str], int]: Best match and score
@@ -306,32 +350,97 @@ class GroupMatcher:
         if not attendee_names:
             return None, 0
         
-        norm_discord = self.normalize_name(discord_name)
-        norm_attendees = [self.normalize_name(name) for name in attendee_names]
+        # Only normalize names the caller has not already normalized
+        if norm_discord is None:
+            norm_discord = self.normalize_name(discord_name)
+        if norm_attendees is None:
+            norm_attendees = [self.normalize_name(name) for name in attendee_names]
         
         # Check for exact matches first
-        for i, norm_attendee in enumerate(norm_attendees):
-            if norm_discord == norm_attendee:
-                return attendee_names[i], 100
+        if exact_index is None:
+            exact_index = self.build_exact_index(norm_attendees)
+        exact = exact_index.get(norm_discord)
+        if exact is not None:
+            return attendee_names[exact], 100
         
         # Check for name containment
         for i, norm_attendee in enumerate(norm_attendees):
             if (norm_discord in norm_attendee) or (norm_attendee in norm_discord):
                 return attendee_names[i], 90
         
-        # Fall back to fuzzy matching
-        best_match, score = process.extractOne(
+        # Fall back to fuzzy matching (names are already normalized).
+        # WRatio is less eager than token_set_ratio, which scores any token subset as 100.
+        # The cutoff lets rapidfuzz skip candidates that cannot round up to the threshold.
+        result = process.extractOne(
             norm_discord, 
             norm_attendees,
-            scorer=fuzz.token_set_ratio
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=self.threshold - 0.5
         )
+        if result is None:
+            return None, 0
+        
+        _, score, idx = result
+        score = int(round(score))
         
         if score >= self.threshold:
-            idx = norm_attendees.index(best_match)
             return attendee_names[idx], score
         
         return None, score
     
+    def _match_group(self, discord_member_ids: List[str], attendee_group: Optional[str],
+                     group_indices: Optional[np.ndarray], discord_members: Dict[str, Dict[str, Any]],
+                     names: List[str], norm_names: List[str]) -> List[Tuple[int, str, int]]:
+        """
+        Match the members of one Discord group against the attendees of its mapped group.
+        
+        Args:
+            discord_member_ids (List[str]): IDs of the Discord members in the group
+            attendee_group (Optional[str]): Attendee group mapped to the Discord group, if any
+            group_indices (Optional[np.ndarray]): Attendee indices in the mapped group
+            discord_members (Dict[str, Dict[str, Any]]): All Discord members by ID
+            names (List[str]): Names of all attendees, by attendee index
+            norm_names (List[str]): Normalized names of all attendees, by attendee index
+            
+        Returns:
+            List[Tuple[int, str, int]]: (attendee index, Discord ID, score) for each match
+        """
+        matches = []
+        if not attendee_group or group_indices is None:
+            return matches
+        
+        # Get attendees in this group
+        group_attendee_names = [names[i] for i in group_indices]
+        group_attendee_norm_names = [norm_names[i] for i in group_indices]
+        group_exact_index = self.build_exact_index(group_attendee_norm_names)
+        
+        # Map each attendee name to its attendee index (first one if names repeat)
+        name_to_index = {}
+        for i, name in zip(group_indices.tolist(), group_attendee_names):
+            name_to_index.setdefault(name, i)
+        
+        # For each Discord member in this group
+        for discord_id in discord_member_ids:
+            discord_member = discord_members[discord_id]
+            
+            # Try to match with an attendee by name
+            best_match, score = self.match_by_name(
+                discord_member['display_name'],
+                group_attendee_names,
+                norm_attendees=group_attendee_norm_names,
+                norm_discord=discord_member['normalized_name'],
+                exact_index=group_exact_index
+            )
+            
+            if best_match and score >= self.threshold:
+                # Find the attendee index
+                index = name_to_index.get(best_match)
+                if index is not None:
+                    matches.append((index, discord_id, score))
+        
+        return matches
+    
     def find_missing_attendees(self, discord_file: str, attendee_file: str) -> Dict[str, Any]:
         """
         Find attendees missing from Discord using group-first matching.
@@ -357,67 +466,59 @@ class GroupMatcher:
             self._debug_print("Mapping Discord groups to attendee groups")
         group_mapping = self.map_groups(discord_groups, attendee_groups)
         
+        # Lay out the fields used for matching as parallel columns, indexed by attendee position
+        attendee_ids = list(attendees.keys())
+        names = [attendee['name'] for attendee in attendees.values()]
+        norm_names = [attendee['normalized_name'] for attendee in attendees.values()]
+        index_of = {attendee_id: i for i, attendee_id in enumerate(attendee_ids)}
+        group_indices = {
+            group: np.fromiter((index_of[a_id] for a_id in ids), dtype=np.intp, count=len(ids))
+            for group, ids in attendee_groups.items()
+        }
+        
         # Find matches and missing attendees
         matches = []
         missing = []
         missing_by_group = {}
         
-        # Create a set to track matched attendees
-        matched_attendees = set()
+        # Track matched attendees by index
+        matched = np.zeros(len(attendee_ids), dtype=bool)
         
         # First pass: match by group and name
         for discord_group, discord_member_ids in discord_groups.items():
             # Find corresponding attendee group
             attendee_group = group_mapping.get(discord_group)
-            
-            if attendee_group:
-                # Get attendees in this group
-                group_attendee_ids = attendee_groups.get(attendee_group, [])
-                group_attendee_names = [attendees[a_id]['name'] for a_id in group_attendee_ids]
-                
-                # For each Discord member in this group
-                for discord_id in discord_member_ids:
-                    discord_member = discord_members[discord_id]
-                    
-                    # Try to match with an attendee by name
-                    best_match, score = self.match_by_name(
-                        discord_member['display_name'],
-                        group_attendee_names
-                    )
-                    
-                    if best_match and score >= self.threshold:
-                        # Find the attendee ID
-                        for a_id in group_attendee_ids:
-                            if attendees[a_id]['name'] == best_match:
-                                matches.append({
-                                    'discord_id': discord_id,
-                                    'discord_name': discord_member['display_name'],
-                                    'attendee_id': a_id,
-                                    'attendee_name': best_match,
-                                    'group': attendee_group,
-                                    'score': score,
-                                    'match_type': 'group_and_name'
-                                })
-                                matched_attendees.add(a_id)
-                                break
+            group_matches = self._match_group(discord_member_ids, attendee_group,
+                                              group_indices.get(attendee_group), discord_members,
+                                              names, norm_names)
+            for index, discord_id, score in group_matches:
+                matches.append({
+                    'discord_id': discord_id,
+                    'discord_name': discord_members[discord_id]['display_name'],
+                    'attendee_id': attendee_ids[index],
+                    'attendee_name': names[index],
+                    'group': attendee_group,
+                    'score': score,
+                    'match_type': 'group_and_name'
+                })
+                matched[index] = True
         
         # Find missing attendees
-        for attendee_id, attendee in attendees.items():
-            if attendee_id not in matched_attendees:
-                missing.append({
-                    'attendee_id': attendee_id,
-                    'id': attendee.get('id', ''),
-                    'name': attendee['name'],
-                    'email': attendee.get('email', ''),
-                    'phone': attendee.get('phone', ''),
-                    'group': attendee['group']
-                })
-                
-                # Organize by group
-                group = attendee['group']
-                if group not in missing_by_group:
-                    missing_by_group[group] = []
-                missing_by_group[group].append(attendee)
+        for index in np.flatnonzero(~matched):
+            attendee_id = attendee_ids[index]
+            attendee = attendees[attendee_id]
+            missing.append({
+                'attendee_id': attendee_id,
+                'id': attendee.get('id', ''),
+                'name': attendee['name'],
+                'email': attendee.get('email', ''),
+                'phone': attendee.get('phone', ''),
+                'group': attendee['group']
+            })
+            
+            # Organize by group
+            group = attendee['group']
+            missing_by_group.setdefault(group, []).append(attendee)
         
         if self.debug:
             self._debug_print(f"Found {len(matches)} matches")
@@ -446,17 +547,17 @@ class GroupMatcher:
             Tuple[str, str]: Paths to text and Excel reports
         """
         # Create timestamp for filenames
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         
         # Ensure output directory exists
-        import os
         os.makedirs("output", exist_ok=True)
         
         # Generate text report
         txt_filename = f"output/missing_attendees_group_{timestamp}.txt"
         with open(txt_filename, 'w', encoding='utf-8') as f:
             # Write summary
-            f.write(f"Missing Attendees Report (Group-Based) - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Missing Attendees Report (Group-Based) - {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Total Discord Members: {results['total_discord']}\n")
             f.write(f"Total Attendees: {results['total_attendees']}\n")
             f.write(f"Missing Attendees: {len(results['missing'])} out of {results['total_attendees']}\n\n")
@@ -466,13 +567,8 @@ class GroupMatcher:
             f.write("-" * 40 + "\n\n")
             
             # Calculate total group sizes for each group in missing_by_group
-            group_totals = {}
-            for group, _ in results['missing_by_group'].items():
-                # Count total attendees in this group
-                group_totals[group] = 0
-                for attendee_group, attendees in results['attendee_groups'].items():
-                    if group == attendee_group:
-                        group_totals[group] = len(attendees)
+            attendee_groups = results['attendee_groups']
+            group_totals = {group: len(attendee_groups.get(group, [])) for group in results['missing_by_group']}
             
             for group, attendees in sorted(results['missing_by_group'].items()):
                 total_in_group = group_totals.get(group, 0)
@@ -486,36 +582,34 @@ class GroupMatcher:
         # Generate Excel report
         excel_filename = f"output/missing_attendees_group_{timestamp}.xlsx"
         
-        # Create DataFrames with selected columns for missing attendees
-        # Format the data to ensure we have all the fields we want
-        formatted_missing = []
-        for attendee in results['missing']:
-            formatted_missing.append({
-                'ID': attendee.get('id', ''),
-                'Name': attendee.get('name', ''),
-                'Email': attendee.get('email', ''),
-                'Phone': attendee.get('phone', ''),
-                'Group': attendee.get('group', '')
-            })
-        
-        missing_df = pd.DataFrame(formatted_missing)
+        # Stream rows straight into a write-only workbook
+        workbook = Workbook(write_only=True)
         
-        # Create Excel writer and save
-        with pd.ExcelWriter(excel_filename) as writer:
-            missing_df.to_excel(writer, sheet_name='Missing Attendees', index=False)
-            
-            # Create group mapping sheet
-            mapping_data = []
+        # Missing attendees sheet with the fields we want
+        missing_sheet = workbook.create_sheet('Missing Attendees')
+        missing_sheet.append(['ID', 'Name', 'Email', 'Phone', 'Group'])
+        for attendee in results['missing']:
+            missing_sheet.append([
+                attendee.get('id', ''),
+                attendee.get('name', ''),
+                attendee.get('email', ''),
+                attendee.get('phone', ''),
+                attendee.get('group', '')
+            ])
+        
+        # Group mapping sheet
+        if results['group_mapping']:
+            mapping_sheet = workbook.create_sheet('Group Mapping')
+            mapping_sheet.append(['Discord Group', 'Attendee Group', 'Discord Members', 'Attendees'])
             for discord_group, attendee_group in results['group_mapping'].items():
-                mapping_data.append({
-                    'Discord Group': discord_group,
-                    'Attendee Group': attendee_group,
-                    'Discord Members': len(results['discord_groups'].get(discord_group, [])),
-                    'Attendees': len(results['attendee_groups'].get(attendee_group, []))
-                })
-            
-            if mapping_data:
-                pd.DataFrame(mapping_data).to_excel(writer, sheet_name='Group Mapping', index=False)
+                mapping_sheet.append([
+                    discord_group,
+                    attendee_group,
+                    len(results['discord_groups'].get(discord_group, [])),
+                    len(results['attendee_groups'].get(attendee_group, []))
+                ])
+        
+        workbook.save(excel_filename)
         
         return txt_filename, excel_filename
 
@@ -1,9 +1,82 @@
-from fuzzywuzzy import fuzz, process
-import re
+from rapidfuzz import fuzz, process, utils
 import os
 import heapq
+import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Set
 from datetime import datetime
+from functools import lru_cache
+
+# Punctuation that _normalize_impl turns into spaces. '/' and '#' are not in it,
+# since the group prefix and discriminator they mark are cut off first.
+_SPECIAL_CHARS_TABLE = str.maketrans({char: ' ' for char in '.,-_()[]{}:;'})
+
+@lru_cache(maxsize=65536)
+def _normalize_impl(name: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Normalize a name as described in NameMatcher.normalize_name.
+    GroupMatcher.normalize_name uses it too, so both matchers share this cache.
+    
+    Args:
+        name (str): The name to normalize
+        
+    Returns:
+        Tuple[str, Tuple[str, ...]]: Normalized name and the changes applied (for debug output)
+    """
+    changes = []
+    
+    # Extract name after slash if present (for "Group Name / Person Name" format)
+    after_slash = name.partition('/')[2].partition('/')[0].strip()
+    if after_slash:
+        name = after_slash
+        changes.append("slash_extracted")
+    
+    # Convert to lowercase
+    normalized = name.lower()
+    
+    # Remove Discord discriminators (e.g., #1234)
+    if '#' in normalized:
+        normalized = normalized.partition('#')[0]
+        changes.append("discriminator_removed")
+    
+    # Remove special characters
+    chars_before = normalized
+    normalized = normalized.translate(_SPECIAL_CHARS_TABLE)
+    if chars_before != normalized:
+        changes.append("special_chars_removed")
+    
+    # Trim and remove consecutive spaces
+    normalized = ' '.join(normalized.split())
+    
+    return normalized, tuple(changes)
+
+# Scorers whose best result gives the similarity score of two names.
+# The token based scorers clean their input like fuzzywuzzy did.
+_SCORERS = (
+    (fuzz.ratio, None),
+    (fuzz.partial_ratio, None),
+    (fuzz.token_sort_ratio, utils.default_process),
+    (fuzz.token_set_ratio, utils.default_process),
+)
+
+@lru_cache(maxsize=100000)
+def _pair_scores(norm_discord: str, norm_attendee: str) -> Tuple[int, ...]:
+    """
+    Score two normalized names with each scorer in _SCORERS.
+    Cached so repeated pairs (duplicate names, repeated reports) are only scored once.
+    
+    Args:
+        norm_discord (str): Normalized Discord username
+        norm_attendee (str): Normalized attendee name
+        
+    Returns:
+        Tuple[int, ...]: Rounded score from each scorer, in _SCORERS order
+    """
+    scores = []
+    for scorer, processor in _SCORERS:
+        a, b = (processor(norm_discord), processor(norm_attendee)) if processor else (norm_discord, norm_attendee)
+        # An empty name scores 0, as with fuzzywuzzy, rather than 100 against another empty name
+        scores.append(int(round(scorer(a, b))) if a and b else 0)
+    return tuple(scores)
 
 class NameMatcher:
     """
@@ -21,8 +94,16 @@ class NameMatcher:
         self.threshold = similarity_threshold
         self.debug = debug
         self.debug_file = None
-        self._processed_attendees = {}  # Cache for processed attendee names
-        self._processed_discord = {}    # Cache for processed Discord names
+        self._debug_fh = None  # Open handle to debug_file while debugging
+    
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clear the normalization and pair score caches shared by all matchers.
+        Useful in long-running processes such as the bot once an attendee list is no longer in use.
+        """
+        _normalize_impl.cache_clear()
+        _pair_scores.cache_clear()
     
     def set_debug(self, debug: bool, debug_file: Optional[str] = None):
         """
@@ -32,23 +113,32 @@ class NameMatcher:
             debug (bool): Whether to output detailed debug information
             debug_file (Optional[str]): Path to a file to write debug output
         """
+        self.close()
         self.debug = debug
         self.debug_file = debug_file
         
-        # Initialize debug file if specified
+        # Initialize debug file if specified, keeping it open for later messages
         if debug and debug_file:
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(f"Name Matcher Debug Log - {datetime.now()}\n")
-                f.write(f"Similarity threshold: {self.threshold}\n")
-                f.write("-" * 80 + "\n\n")
+            self._debug_fh = open(debug_file, 'w', encoding='utf-8', buffering=65536)
+            self._debug_fh.write(f"Name Matcher Debug Log - {datetime.now()}\n")
+            self._debug_fh.write(f"Similarity threshold: {self.threshold}\n")
+            self._debug_fh.write("-" * 80 + "\n\n")
+    
+    def close(self):
+        """Flush and close the debug file, if one is open."""
+        if self._debug_fh is not None:
+            self._debug_fh.close()
+            self._debug_fh = None
+    
+    def __del__(self):
+        self.close()
     
     def _debug_print(self, message: str):
         """Print debug message if debug mode is enabled."""
         if self.debug:
             print(message)
-            if self.debug_file:
-                with open(self.debug_file, 'a', encoding='utf-8') as f:
-                    f.write(message + "\n")
+            if self._debug_fh is not None:
+                self._debug_fh.write(message + "\n")
     
     def normalize_name(self, name: str) -> str:
         """
@@ -66,51 +156,103 @@ class NameMatcher:
         """
         if not name:
             return ""
-            
-        # Keep the original for debugging
-        original = name
-        
-        # Extract name after slash if present (for "Group Name / Person Name" format)
-        slash_extracted = False
-        if '/' in name:
-            parts = name.split('/')
-            if len(parts) > 1 and len(parts[1].strip()) > 0:
-                name = parts[1].strip()
-                slash_extracted = True
-        
-        # Convert to lowercase
-        normalized = name.lower()
-        
-        # Remove Discord discriminators (e.g., #1234)
-        if '#' in normalized:
-            discriminator_removed = True
-            normalized = normalized.split('#')[0]
-        else:
-            discriminator_removed = False
         
-        # Remove special characters
-        chars_before = normalized
-        for char in ['.', ',', '-', '_', '(', ')', '[', ']', '{', '}', ':', ';']:
-            normalized = normalized.replace(char, ' ')
-        chars_removed = (chars_before != normalized)
-        
-        # Trim and remove consecutive spaces
-        normalized = ' '.join(normalized.split())
+        normalized, changes = _normalize_impl(name)
         
         if self.debug:
-            changes = []
-            if slash_extracted:
-                changes.append("slash_extracted")
-            if discriminator_removed:
-                changes.append("discriminator_removed")
-            if chars_removed:
-                changes.append("special_chars_removed")
-            
             change_str = ", ".join(changes) if changes else "no_changes"
-            self._debug_print(f"Normalize: '{original}' -> '{normalized}' ({change_str})")
+            self._debug_print(f"Normalize: '{name}' -> '{normalized}' ({change_str})")
         
         return normalized
     
+    def _score_matrix(self, norm_discord: List[str], norm_attendees: List[str]) -> np.ndarray:
+        """
+        Compute the similarity score of every Discord/attendee pair in one batch.
+        Each cell equals the 'max_score' that get_detailed_scores gives for the pair.
+        
+        Args:
+            norm_discord (List[str]): Normalized Discord names
+            norm_attendees (List[str]): Normalized attendee names
+            
+        Returns:
+            np.ndarray: uint8 score matrix of shape (len(norm_discord), len(norm_attendees))
+        """
+        scores = np.zeros((len(norm_discord), len(norm_attendees)), dtype=np.uint8)
+        if not norm_discord or not norm_attendees:
+            return scores
+        
+        # An exact match always scores 100 with fuzz.ratio, and a contained name scores
+        # 100 with fuzz.partial_ratio, so those checks never raise the maximum here.
+        # Scores are rounded here rather than with cdist's dtype=np.uint8, which rounds
+        # halves up where int(round(...)) in _pair_scores rounds them to even.
+        # Names that are empty (after processing) score 0, as in _pair_scores.
+        for scorer, processor in _SCORERS:
+            matrix = process.cdist(norm_discord, norm_attendees, scorer=scorer,
+                                   processor=processor, workers=-1)
+            process_name = processor or (lambda name: name)
+            matrix[[not process_name(name) for name in norm_discord], :] = 0
+            matrix[:, [not process_name(name) for name in norm_attendees]] = 0
+            np.maximum(scores, np.rint(matrix, out=matrix).astype(np.uint8), out=scores)
+        
+        return scores
+    
+    def _top_indices(self, scores: np.ndarray, attendee_names: List[str], top_n: int) -> List[int]:
+        """
+        Pick the indices of the top N attendees from a row of the score matrix.
+        Ties are broken as by a min heap of N filled in attendee order: a tied attendee only
+        takes a slot that is free or held by a lower score, and the result is ordered by
+        score and then by name, both descending.
+        
+        Args:
+            scores (np.ndarray): Scores of a Discord name against each attendee name
+            attendee_names (List[str]): Attendee names the scores refer to
+            top_n (int): Number of top matches to return
+            
+        Returns:
+            List[int]: Indices into attendee_names, best first
+        """
+        if top_n < len(scores):
+            # Only attendees scoring at least the Nth best score can end up in the heap;
+            # lower scores would only take slots that these candidates displace
+            kth_score = np.partition(scores, len(scores) - top_n)[len(scores) - top_n]
+            candidates = np.flatnonzero(scores >= kth_score)
+        else:
+            candidates = np.arange(len(scores))
+        
+        heap = []
+        for index, score in zip(candidates.tolist(), scores[candidates].tolist()):
+            entry = (score, attendee_names[index], index)
+            if len(heap) < top_n:
+                heapq.heappush(heap, entry)
+            elif score > heap[0][0]:
+                heapq.heappushpop(heap, entry)
+        return [index for _, _, index in sorted(heap, reverse=True)]
+    
+    def _top_matches(self, discord_name: str, attendee_names: List[str], norm_discord: str,
+                     norm_attendees: List[str], scores: np.ndarray,
+                     top_n: int) -> List[Tuple[Optional[str], int, Dict[str, Any]]]:
+        """
+        Pick the top N attendees for a Discord name from its row of the score matrix.
+        
+        Args:
+            discord_name (str): Discord username
+            attendee_names (List[str]): Attendee names the scores refer to
+            norm_discord (str): Normalized Discord username
+            norm_attendees (List[str]): Normalized attendee names, parallel to attendee_names
+            scores (np.ndarray): Scores of discord_name against each attendee name
+            top_n (int): Number of top matches to return
+            
+        Returns:
+            List[Tuple[Optional[str], int, Dict[str, Any]]]: (match_name, score, details) tuples,
+            best first, with ties broken as described in _top_indices
+        """
+        results = []
+        for index in self._top_indices(scores, attendee_names, top_n):
+            _, score, details = self._match_normalized(discord_name, attendee_names[index],
+                                                       norm_discord, norm_attendees[index])
+            results.append((attendee_names[index], score, details))
+        return results
+    
     def get_detailed_scores(self, discord_name: str, attendee_name: str) -> Dict[str, int]:
         """
         Get detailed similarity scores between a Discord name and an attendee name.
@@ -126,15 +268,25 @@ class NameMatcher:
         norm_discord = self.normalize_name(discord_name)
         norm_attendee = self.normalize_name(attendee_name)
         
+        return self._scores_for_normalized(norm_discord, norm_attendee)
+    
+    def _scores_for_normalized(self, norm_discord: str, norm_attendee: str) -> Dict[str, int]:
+        """
+        Get detailed similarity scores between two already normalized names.
+        
+        Args:
+            norm_discord (str): Normalized Discord username
+            norm_attendee (str): Normalized attendee name
+            
+        Returns:
+            Dict[str, int]: Dictionary of different similarity scores
+        """
         # Calculate various similarity scores
-        ratio = fuzz.ratio(norm_discord, norm_attendee)
-        partial_ratio = fuzz.partial_ratio(norm_discord, norm_attendee)
-        token_sort_ratio = fuzz.token_sort_ratio(norm_discord, norm_attendee)
-        token_set_ratio = fuzz.token_set_ratio(norm_discord, norm_attendee)
+        ratio, partial_ratio, token_sort_ratio, token_set_ratio = _pair_scores(norm_discord, norm_attendee)
         
         # Simple exact match or contained check
-        exact_match = 100 if norm_discord == norm_attendee else 0
-        contained = 90 if (norm_discord in norm_attendee or norm_attendee in norm_discord) else 0
+        exact_match = 100 if norm_discord and norm_discord == norm_attendee else 0
+        contained = 90 if norm_discord and norm_attendee and (norm_discord in norm_attendee or norm_attendee in norm_discord) else 0
         
         return {
             'exact_match': exact_match,
@@ -157,8 +309,26 @@ class NameMatcher:
         Returns:
             Tuple[bool, int, Dict[str, Any]]: (is_match, similarity_score, detailed_info)
         """
-        # Get detailed scores
-        scores = self.get_detailed_scores(discord_name, attendee_name)
+        # Normalize each name once and get detailed scores
+        norm_discord = self.normalize_name(discord_name)
+        norm_attendee = self.normalize_name(attendee_name)
+        return self._match_normalized(discord_name, attendee_name, norm_discord, norm_attendee)
+    
+    def _match_normalized(self, discord_name: str, attendee_name: str, norm_discord: str,
+                          norm_attendee: str) -> Tuple[bool, int, Dict[str, Any]]:
+        """
+        Check if a Discord username matches an attendee name, given both normalized names.
+        
+        Args:
+            discord_name (str): Discord username
+            attendee_name (str): Attendee name from the CSV
+            norm_discord (str): Normalized Discord username
+            norm_attendee (str): Normalized attendee name
+            
+        Returns:
+            Tuple[bool, int, Dict[str, Any]]: (is_match, similarity_score, detailed_info)
+        """
+        scores = self._scores_for_normalized(norm_discord, norm_attendee)
         max_score = scores['max_score']
         
         # Track which method gave the max score
@@ -179,8 +349,8 @@ class NameMatcher:
         details = {
             'scores': scores,
             'best_method': method,
-            'norm_discord': self.normalize_name(discord_name),
-            'norm_attendee': self.normalize_name(attendee_name),
+            'norm_discord': norm_discord,
+            'norm_attendee': norm_attendee,
             'threshold': self.threshold
         }
         
@@ -209,25 +379,28 @@ class NameMatcher:
         if not attendee_names:
             return [(None, 0, {})]
         
-        # Create a priority queue to store top N matches
-        best_matches = []
-        
         if self.debug:
             self._debug_print(f"\nFinding best match for Discord name: '{discord_name}'")
             self._debug_print(f"Checking against {len(attendee_names)} attendee names")
         
-        # Check against each attendee name
-        for attendee_name in attendee_names:
-            is_match, score, details = self.is_match(discord_name, attendee_name)
-            
-            # Use a min heap to keep track of top N matches
-            if len(best_matches) < return_top_n:
-                heapq.heappush(best_matches, (score, attendee_name, details))
-            elif score > best_matches[0][0]:  # If better than worst in top N
-                heapq.heappushpop(best_matches, (score, attendee_name, details))
-        
-        # Convert heap to list of tuples in descending order of score
-        results = [(name, score, details) for score, name, details in sorted(best_matches, reverse=True)]
+        norm_discord = self.normalize_name(discord_name)
+        norm_attendees = [self.normalize_name(name) for name in attendee_names]
+        norm_to_index = {}
+        for i, norm_attendee in enumerate(norm_attendees):
+            norm_to_index.setdefault(norm_attendee, i)
+        
+        exact_index = norm_to_index.get(norm_discord)
+        if return_top_n == 1 and norm_discord and exact_index is not None:
+            # An exact match is the best possible single result, so skip fuzzy scoring
+            attendee_name = attendee_names[exact_index]
+            _, score, details = self._match_normalized(discord_name, attendee_name,
+                                                       norm_discord, norm_attendees[exact_index])
+            results = [(attendee_name, score, details)]
+        else:
+            # Score against every attendee name in one batch
+            scores = self._score_matrix([norm_discord], norm_attendees)[0]
+            results = self._top_matches(discord_name, attendee_names, norm_discord, norm_attendees,
+                                        scores, return_top_n)
         
         if self.debug:
             for name, score, details in results:
@@ -255,21 +428,28 @@ class NameMatcher:
         
         # Pre-process attendee names
         processed_attendees_list = [self.normalize_name(name) for name in attendee_names]
-        processed_attendees = dict(zip(processed_attendees_list, attendee_names))
+        
+        # Pre-process Discord names
+        processed_discord_list = [self.normalize_name(name) for name in discord_users]
         
         # Export processed names for debugging
-        with open("processed_attendees.txt", "w", encoding="utf-8") as f:
-            for orig, processed in zip(attendee_names, processed_attendees_list):
-                f.write(f"{orig}|{processed}\n")
-        
-        # Export processed Discord names
-        with open("processed_discord.txt", "w", encoding="utf-8") as f:
-            for discord_user in discord_users:
-                processed = self.normalize_name(discord_user)
-                f.write(f"{discord_user}|{processed}\n")
-        
-        for discord_user in discord_users:
-            best_matches = self.find_best_match(discord_user, attendee_names, return_top_n=3)
+        if self.debug:
+            with open("processed_attendees.txt", "w", encoding="utf-8") as f:
+                f.write("".join(f"{orig}|{processed}\n"
+                                for orig, processed in zip(attendee_names, processed_attendees_list)))
+            with open("processed_discord.txt", "w", encoding="utf-8") as f:
+                f.write("".join(f"{discord_user}|{processed}\n"
+                                for discord_user, processed in zip(discord_users, processed_discord_list)))
+        
+        # Score every Discord name against every attendee name in one batch
+        score_matrix = self._score_matrix(processed_discord_list, processed_attendees_list)
+        
+        for row, discord_user in enumerate(discord_users):
+            if attendee_names:
+                best_matches = self._top_matches(discord_user, attendee_names, processed_discord_list[row],
+                                                 processed_attendees_list, score_matrix[row], 3)
+            else:
+                best_matches = [(None, 0, {})]
             if best_matches and best_matches[0][1] >= self.threshold:
                 best_match, score, details = best_matches[0]
                 results[discord_user] = {
@@ -291,15 +471,14 @@ class NameMatcher:
                 }
         
         # Export closest matches for debugging
-        with open("closest_matches.txt", "w", encoding="utf-8") as f:
-            f.write("Discord Name|Top 3 Closest Matches\n")
+        if self.debug:
+            lines = ["Discord Name|Top 3 Closest Matches\n"]
             for discord_user, info in results.items():
-                matches_str = ""
-                for name, score, _ in info.get('top_matches', []):
-                    if name:
-                        matches_str += f"{name} ({score}), "
-                matches_str = matches_str.rstrip(", ")
-                f.write(f"{discord_user}|{matches_str}\n")
+                matches_str = ", ".join(f"{name} ({score})"
+                                        for name, score, _ in info.get('top_matches', []) if name)
+                lines.append(f"{discord_user}|{matches_str}\n")
+            with open("closest_matches.txt", "w", encoding="utf-8") as f:
+                f.write("".join(lines))
         
         return results
     
@@ -321,12 +500,31 @@ class NameMatcher:
             self._debug_print(f"Discord users: {len(discord_users)}")
             self._debug_print(f"Attendees: {len(attendee_names)}")
         
-        # First, find all matches
-        matches = self.find_matches_for_discord_users(discord_users, attendee_names)
-        
-        # Create a list of attendees who were matched
-        matched_attendees = [info['match_name'] for info in matches.values() 
-                             if info['matched'] and info['match_name']]
+        if self.debug:
+            # Go through the full per-user matching so its logs and exports are written
+            matches = self.find_matches_for_discord_users(discord_users, attendee_names)
+            
+            # Create a set of attendees who were matched
+            matched_attendees = {info['match_name'] for info in matches.values() 
+                                 if info['matched'] and info['match_name']}
+        elif discord_users and attendee_names:
+            # Each Discord user matches its best scoring attendee if that score reaches the
+            # threshold, as in find_matches_for_discord_users
+            score_matrix = self._score_matrix([self.normalize_name(name) for name in discord_users],
+                                              [self.normalize_name(name) for name in attendee_names])
+            best_indices = score_matrix.argmax(axis=1)
+            best_scores = score_matrix[np.arange(len(discord_users)), best_indices]
+            
+            # Where several attendees share the best score, break the tie as its top 3 does
+            tied = (score_matrix == best_scores[:, None]).sum(axis=1) > 1
+            for row in np.flatnonzero(tied & (best_scores >= self.threshold)).tolist():
+                best_indices[row] = self._top_indices(score_matrix[row], attendee_names, 3)[0]
+            # Empty attendee names never count as matched, as in the debug path
+            matched_attendees = {attendee_names[index]
+                                 for index in best_indices[best_scores >= self.threshold].tolist()
+                                 if attendee_names[index]}
+        else:
+            matched_attendees = set()
         
         if self.debug:
             self._debug_print(f"Matched attendees: {len(matched_attendees)}")
@@ -354,11 +552,12 @@ class NameMatcher:
         self.debug = True
         
         # Create a timestamp for the filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         report_file = f"matching_debug_{timestamp}.txt"
         
         with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(f"Name Matching Debug Report - {datetime.now()}\n")
+            f.write(f"Name Matching Debug Report - {now}\n")
             f.write(f"Similarity Threshold: {self.threshold}\n")
             f.write(f"Sample Size: {min(sample_size, len(attendee_names))}\n")
             f.write(f"Total Discord Users: {len(discord_users)}\n")
@@ -368,22 +567,29 @@ class NameMatcher:
             # Sample attendees (use all if fewer than sample_size)
             sample = attendee_names[:sample_size] if len(attendee_names) > sample_size else attendee_names
             
+            # Normalize the Discord names once for all sampled attendees
+            norm_discord_users = [self.normalize_name(discord_user) for discord_user in discord_users]
+            
             for i, attendee in enumerate(sample):
+                norm_attendee = self.normalize_name(attendee)
                 f.write(f"ATTENDEE {i+1}: {attendee}\n")
-                f.write(f"Normalized: {self.normalize_name(attendee)}\n")
+                f.write(f"Normalized: {norm_attendee}\n")
                 
-                # Find top 3 potential matches from Discord
-                temp_debug_file = self.debug_file
-                self.debug_file = report_file
+                # Score every Discord user in one batch and keep the top 3 (best score,
+                # then Discord name, first)
+                scores = self._score_matrix(norm_discord_users, [norm_attendee])[:, 0].tolist()
+                top_indices = heapq.nlargest(3, range(len(discord_users)),
+                                             key=lambda index: (scores[index], discord_users[index]))
                 
-                best_matches = []
-                for discord_user in discord_users:
-                    is_match, score, details = self.is_match(discord_user, attendee)
-                    best_matches.append((score, discord_user, details))
+                # Get detailed scores for the top 3 only, logging into the report
+                temp_debug_fh = self._debug_fh
+                self._debug_fh = f
                 
-                # Get top 3 matches
-                best_matches.sort(reverse=True)
-                top_matches = best_matches[:3]
+                top_matches = []
+                for index in top_indices:
+                    _, score, details = self._match_normalized(discord_users[index], attendee,
+                                                               norm_discord_users[index], norm_attendee)
+                    top_matches.append((score, discord_users[index], details))
                 
                 f.write("\nTop 3 Potential Discord Matches:\n")
                 for j, (score, discord_user, details) in enumerate(top_matches):
@@ -397,7 +603,7 @@ class NameMatcher:
                     f.write(f"token_sort={details['scores']['token_sort_ratio']}, ")
                     f.write(f"token_set={details['scores']['token_set_ratio']}\n")
                 
-                self.debug_file = temp_debug_file
+                self._debug_fh = temp_debug_fh
                 f.write("\n" + "-" * 60 + "\n\n")
         
         # Restore original debug setting
@@ -0,0 +1,19 @@
+import pandas as pd
+
+def write_attendee_csv(path, names, groups):
+    """
+    Write an attendee CSV laid out like the registration export.
+
+    Args:
+        path (str): Path of the CSV file to write
+        names (List[str]): Attendee names, written to the second column
+        groups (List[str]): Attendee groups, written to the twelfth column
+    """
+    data = {'Column1': list(range(1, len(names) + 1)), 'Name': list(names)}
+
+    # Filler columns stand in for the rest of the export
+    for i in range(3, 12):
+        data[f'Column{i}'] = [chr(ord('A') + i - 3)] * len(names)
+    data['Group'] = list(groups)
+
+    pd.DataFrame(data).to_csv(path, index=False)
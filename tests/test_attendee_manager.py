@@ -2,46 +2,31 @@ import unittest
 import os
 import tempfile
 import pandas as pd
-from src.attendee_manager import AttendeeManager
+from unittest import mock
+from src.attendee_manager import AttendeeManager, _read_attendee_columns
+from tests.helpers import write_attendee_csv
+
+# Names and groups expected from the fixture CSV, in file order
+EXPECTED_ATTENDEES = pd.DataFrame([
+    {'name': 'John Doe', 'group': 'Team A'},
+    {'name': 'Jane Smith', 'group': 'Team A'},
+    {'name': 'Bob Johnson', 'group': 'Team B'},
+    {'name': 'Alice Brown', 'group': 'Team B'},
+])
 
 class TestAttendeeManager(unittest.TestCase):
     
-    def setUp(self):
-        # Create a temporary CSV file for testing
-        self.temp_csv = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
-        
-        # Create sample data
-        data = {
-            'Column1': [1, 2, 3, 4],
-            'Name': ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown'],
-            'Column3': ['A', 'B', 'C', 'D'],
-            'Column4': ['X', 'Y', 'Z', 'W'],
-            'Column5': [10, 20, 30, 40],
-            'Column6': ['AA', 'BB', 'CC', 'DD'],
-            'Column7': [100, 200, 300, 400],
-            'Column8': ['XX', 'YY', 'ZZ', 'WW'],
-            'Column9': [1000, 2000, 3000, 4000],
-            'Column10': ['AAA', 'BBB', 'CCC', 'DDD'],
-            'Column11': [5, 6, 7, 8],
-            'Group': ['Team A', 'Team A', 'Team B', 'Team B']
-        }
-        
-        df = pd.DataFrame(data)
-        df.to_csv(self.temp_csv.name, index=False)
-        
-        # Save the path for use in tests
-        self.csv_path = self.temp_csv.name
-        
-        # Set the environment variable for testing
-        os.environ['ATTENDEE_LIST_PATH'] = self.csv_path
+    @classmethod
+    def setUpClass(cls):
+        # Create a temporary CSV file shared by all tests; none of them modify it
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as temp_csv:
+            cls.csv_path = temp_csv.name
+        write_attendee_csv(cls.csv_path, EXPECTED_ATTENDEES['name'], EXPECTED_ATTENDEES['group'])
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         # Clean up the temporary file
-        os.unlink(self.temp_csv.name)
-        
-        # Clean up environment variable
-        if 'ATTENDEE_LIST_PATH' in os.environ:
-            del os.environ['ATTENDEE_LIST_PATH']
+        os.unlink(cls.csv_path)
     
     def test_init_with_path(self):
         # Test initialization with a direct path
@@ -49,8 +34,9 @@ class TestAttendeeManager(unittest.TestCase):
         self.assertEqual(manager.file_path, self.csv_path)
     
     def test_init_with_env_var(self):
-        # Test initialization with an environment variable
-        manager = AttendeeManager()
+        # Test initialization with an environment variable, set only for this test
+        with mock.patch.dict(os.environ, {'ATTENDEE_LIST_PATH': self.csv_path}):
+            manager = AttendeeManager()
         self.assertEqual(manager.file_path, self.csv_path)
     
     def test_load_attendees(self):
@@ -61,16 +47,12 @@ class TestAttendeeManager(unittest.TestCase):
         # Check that the correct number of attendees were loaded
         self.assertEqual(len(manager.get_attendees()), 4)
         
-        # Check that the names and groups were extracted correctly
-        attendees = manager.get_attendees()
-        self.assertEqual(attendees[0]['name'], 'John Doe')
-        self.assertEqual(attendees[0]['group'], 'Team A')
-        self.assertEqual(attendees[1]['name'], 'Jane Smith')
-        self.assertEqual(attendees[1]['group'], 'Team A')
-        self.assertEqual(attendees[2]['name'], 'Bob Johnson')
-        self.assertEqual(attendees[2]['group'], 'Team B')
-        self.assertEqual(attendees[3]['name'], 'Alice Brown')
-        self.assertEqual(attendees[3]['group'], 'Team B')
+        # Check that the names and groups were extracted correctly, in file order
+        attendees = pd.DataFrame(manager.get_attendees())
+        pd.testing.assert_frame_equal(attendees[['name', 'group']], EXPECTED_ATTENDEES)
+        
+        # The attendees attribute gives the same dictionaries
+        self.assertEqual(manager.attendees, manager.get_attendees())
     
     def test_get_attendee_names(self):
         # Test getting just the attendee names
@@ -79,7 +61,16 @@ class TestAttendeeManager(unittest.TestCase):
         
         names = manager.get_attendee_names()
         self.assertEqual(len(names), 4)
-        self.assertEqual(set(names), {'John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown'})
+        self.assertCountEqual(names, ['John Doe', 'Jane Smith', 'Bob Johnson', 'Alice Brown'])
+    
+    def test_get_attendee_group(self):
+        # Test looking up the group of a single attendee
+        manager = AttendeeManager(self.csv_path)
+        manager.load_attendees()
+        
+        self.assertEqual(manager.get_attendee_group('Bob Johnson'), 'Team B')
+        self.assertEqual(manager.get_attendee_group('Unknown Person'), 'Unknown')
+        self.assertIsNone(manager.get_attendee_group('Unknown Person', default=None))
     
     def test_get_groups(self):
         # Test getting attendees organized by groups
@@ -90,8 +81,8 @@ class TestAttendeeManager(unittest.TestCase):
         self.assertEqual(len(groups), 2)
         self.assertIn('Team A', groups)
         self.assertIn('Team B', groups)
-        self.assertEqual(set(groups['Team A']), {'John Doe', 'Jane Smith'})
-        self.assertEqual(set(groups['Team B']), {'Bob Johnson', 'Alice Brown'})
+        self.assertCountEqual(groups['Team A'], ['John Doe', 'Jane Smith'])
+        self.assertCountEqual(groups['Team B'], ['Bob Johnson', 'Alice Brown'])
     
     def test_get_attendees_by_group(self):
         # Test getting attendees for a specific group
@@ -100,16 +91,56 @@ class TestAttendeeManager(unittest.TestCase):
         
         team_a = manager.get_attendees_by_group('Team A')
         self.assertEqual(len(team_a), 2)
-        self.assertEqual(set(team_a), {'John Doe', 'Jane Smith'})
+        self.assertCountEqual(team_a, ['John Doe', 'Jane Smith'])
         
         team_b = manager.get_attendees_by_group('Team B')
         self.assertEqual(len(team_b), 2)
-        self.assertEqual(set(team_b), {'Bob Johnson', 'Alice Brown'})
+        self.assertCountEqual(team_b, ['Bob Johnson', 'Alice Brown'])
         
         # Test getting attendees for a non-existent group
         unknown_team = manager.get_attendees_by_group('Unknown Team')
         self.assertEqual(len(unknown_team), 0)
     
+    def test_reload_unchanged_file(self):
+        # Test that reloading an unchanged file reuses the parsed columns
+        manager = AttendeeManager(self.csv_path)
+        manager.load_attendees()
+        hits = _read_attendee_columns.cache_info().hits
+
+        other_manager = AttendeeManager(self.csv_path)
+        self.assertTrue(other_manager.load_attendees())
+        self.assertEqual(_read_attendee_columns.cache_info().hits, hits + 1)
+
+        # Changing what one manager returns does not affect the other
+        manager.get_groups()['Team A'].append('Someone Else')
+        manager.get_attendee_names().append('Someone Else')
+        self.assertCountEqual(other_manager.get_groups()['Team A'], ['John Doe', 'Jane Smith'])
+        self.assertEqual(len(other_manager.get_attendee_names()), 4)
+
+    def test_reload_rewritten_file(self):
+        # Test that reloading picks up a rewritten file
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, 'attendees.csv')
+            write_attendee_csv(csv_path, ['John Doe', 'Jane Smith'], ['Team A', 'Team B'])
+            manager = AttendeeManager(csv_path)
+            manager.load_attendees()
+            stat = os.stat(csv_path)
+
+            # New rows with a later modification time
+            write_attendee_csv(csv_path, ['John Doe', 'Jane Smith', 'Bob Johnson'],
+                               ['Team A', 'Team B', 'Team B'])
+            os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertTrue(manager.load_attendees())
+            self.assertEqual(manager.get_attendee_names(), ['John Doe', 'Jane Smith', 'Bob Johnson'])
+
+            # Same size and modification time as the first file, as after cp -p
+            write_attendee_csv(csv_path, ['Jack Doe', 'Jane Smith'], ['Team A', 'Team C'])
+            os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(os.stat(csv_path).st_size, stat.st_size)
+            self.assertTrue(manager.load_attendees())
+            self.assertEqual(manager.get_attendee_names(), ['Jack Doe', 'Jane Smith'])
+            self.assertEqual(manager.get_attendee_group('Jane Smith'), 'Team C')
+
     def test_invalid_file_path(self):
         # Test behavior with an invalid file path
         manager = AttendeeManager('/nonexistent/path.csv')
@@ -0,0 +1,61 @@
+import unittest
+from src.bot import clean_name, find_missing_attendee_names
+from src.name_matcher import NameMatcher
+
+class TestBotHelpers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Create a NameMatcher instance with a threshold of 80, shared since no test changes it
+        cls.matcher = NameMatcher(similarity_threshold=80)
+
+    def test_clean_name_strips_symbols(self):
+        # Test that emoji and decorative symbols are removed
+        test_cases = [
+            ("🎉 John Doe ✨", "john doe"),
+            ("★Jane★ Smith™", "jane smith"),
+            ("Bob 🚀Johnson", "bob johnson"),
+            ("José Núñez", "josé núñez"),
+            ("Mary-Jane O'Neil", "mary-jane oneil"),
+        ]
+
+        for input_name, expected_output in test_cases:
+            with self.subTest(input_name=input_name):
+                self.assertEqual(clean_name(input_name), expected_output)
+
+    def test_clean_name_keeps_separators(self):
+        # Test that the separators NameMatcher.normalize_name handles are kept
+        test_cases = [
+            ("John.Doe", "john.doe"),
+            ("john_doe#1234", "john_doe#1234"),
+            ("Team A / Jane Smith", "team a / jane smith"),
+            ("Jane (JS) [x] {y}: z; w, v", "jane (js) [x] {y}: z; w, v"),
+        ]
+
+        for input_name, expected_output in test_cases:
+            with self.subTest(input_name=input_name):
+                self.assertEqual(clean_name(input_name), expected_output)
+
+    def test_clean_name_empty(self):
+        # Test empty names, and symbol-only names, which are kept as they are
+        self.assertEqual(clean_name(""), "")
+        self.assertEqual(clean_name("🎉✨"), "🎉✨")
+
+    def test_find_missing_attendee_names(self):
+        # Test that names are matched after cleaning and returned as originally written
+        member_names = ["🎉 john_doe", "Jane.Smith ✨"]
+        attendee_names = ["John Doe", "Jane Smith", "Bob Johnson 🚀"]
+
+        missing = find_missing_attendee_names(self.matcher, member_names, attendee_names)
+        self.assertEqual(missing, ["Bob Johnson 🚀"])
+
+        # Test that an emoji-only attendee is not matched by a different emoji-only member
+        self.assertEqual(find_missing_attendee_names(self.matcher, ["🎉🎉", "jane"], ["✨✨", "Jane"]), ["✨✨"])
+        self.assertEqual(find_missing_attendee_names(self.matcher, ["✨✨", "jane"], ["✨✨", "Jane"]), [])
+
+        # Test with no Discord members and with no attendees
+        self.assertEqual(find_missing_attendee_names(self.matcher, [], attendee_names), attendee_names)
+        self.assertEqual(find_missing_attendee_names(self.matcher, member_names, []), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,60 +1,49 @@
 import unittest
 import tempfile
-import pandas as pd
 import os
+from collections import defaultdict
 from src.attendee_manager import AttendeeManager
 from src.name_matcher import NameMatcher
+from tests.helpers import write_attendee_csv
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the attendance checker functionality."""
     
-    def setUp(self):
-        # Create a temporary CSV file for testing
-        self.temp_csv = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+    @classmethod
+    def setUpClass(cls):
+        # Create a temporary CSV file shared by all tests; none of them modify it
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as temp_csv:
+            cls.csv_path = temp_csv.name
         
         # Create sample data
-        data = {
-            'Column1': list(range(1, 11)),
-            'Name': [
-                'John Doe', 
-                'Jane Smith', 
-                'Bob Johnson', 
-                'Alice Brown',
-                'Michael Williams',
-                'Sarah Jones',
-                'David Miller',
-                'Emily Davis',
-                'James Wilson',
-                'Emma Taylor'
-            ],
-            'Column3': ['A'] * 10,
-            'Column4': ['B'] * 10,
-            'Column5': ['C'] * 10,
-            'Column6': ['D'] * 10,
-            'Column7': ['E'] * 10,
-            'Column8': ['F'] * 10,
-            'Column9': ['G'] * 10,
-            'Column10': ['H'] * 10,
-            'Column11': ['I'] * 10,
-            'Group': [
-                'Team Alpha',
-                'Team Alpha',
-                'Team Beta',
-                'Team Beta',
-                'Team Gamma',
-                'Team Gamma',
-                'Team Delta',
-                'Team Delta',
-                'Team Epsilon',
-                'Team Epsilon'
-            ]
-        }
-        
-        df = pd.DataFrame(data)
-        df.to_csv(self.temp_csv.name, index=False)
+        names = [
+            'John Doe', 
+            'Jane Smith', 
+            'Bob Johnson', 
+            'Alice Brown',
+            'Michael Williams',
+            'Sarah Jones',
+            'David Miller',
+            'Emily Davis',
+            'James Wilson',
+            'Emma Taylor'
+        ]
+        groups = [
+            'Team Alpha',
+            'Team Alpha',
+            'Team Beta',
+            'Team Beta',
+            'Team Gamma',
+            'Team Gamma',
+            'Team Delta',
+            'Team Delta',
+            'Team Epsilon',
+            'Team Epsilon'
+        ]
+        write_attendee_csv(cls.csv_path, names, groups)
         
         # Sample Discord usernames (some match, some don't)
-        self.discord_names = [
+        cls.discord_names = [
             'john_doe',              # Match for John Doe
             'jane.smith',            # Match for Jane Smith
             'bobby.j',               # Match for Bob Johnson
@@ -66,13 +55,11 @@ class TestIntegration(unittest.TestCase):
             'james.wilson',          # Match for James Wilson
             'bot_user'               # No match
         ]
-        
-        # Save the path for use in tests
-        self.csv_path = self.temp_csv.name
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         # Clean up the temporary file
-        os.unlink(self.temp_csv.name)
+        os.unlink(cls.csv_path)
     
     def test_end_to_end_workflow(self):
         """Test the entire workflow from CSV loading to missing attendee identification."""
@@ -97,19 +84,17 @@ class TestIntegration(unittest.TestCase):
         
         # 4. Verify results
         expected_missing = ['Alice Brown', 'Emily Davis', 'Emma Taylor']
-        self.assertEqual(sorted(missing_names), sorted(expected_missing))
+        self.assertCountEqual(missing_names, expected_missing)
         
         # 5. Structure missing attendees by group
-        missing_by_group = {}
+        name_to_group = {a['name']: a['group'] for a in attendees}
+        missing_by_group = defaultdict(list)
         for name in missing_names:
-            group = next((a['group'] for a in attendees if a['name'] == name), "Unknown")
-            if group not in missing_by_group:
-                missing_by_group[group] = []
-            missing_by_group[group].append(name)
+            missing_by_group[name_to_group.get(name, "Unknown")].append(name)
         
         # 6. Verify grouping
         self.assertEqual(len(missing_by_group), 3)
-        self.assertEqual(set(missing_by_group.keys()), set(['Team Beta', 'Team Delta', 'Team Epsilon']))
+        self.assertCountEqual(missing_by_group.keys(), ['Team Beta', 'Team Delta', 'Team Epsilon'])
         self.assertEqual(missing_by_group['Team Beta'], ['Alice Brown'])
         self.assertEqual(missing_by_group['Team Delta'], ['Emily Davis'])
         self.assertEqual(missing_by_group['Team Epsilon'], ['Emma Taylor'])
@@ -1,11 +1,16 @@
 import unittest
+import os
+import io
+import tempfile
+import contextlib
 from src.name_matcher import NameMatcher
 
 class TestNameMatcher(unittest.TestCase):
     
-    def setUp(self):
-        # Create a NameMatcher instance with a threshold of 80
-        self.matcher = NameMatcher(similarity_threshold=80)
+    @classmethod
+    def setUpClass(cls):
+        # Create a NameMatcher instance with a threshold of 80, shared since no test changes it
+        cls.matcher = NameMatcher(similarity_threshold=80)
         
     def test_normalize_name(self):
         # Test name normalization
@@ -40,6 +45,10 @@ class TestNameMatcher(unittest.TestCase):
         self.assertFalse(self.matcher.is_match("Alice Smith", "John Doe")[0])
         self.assertFalse(self.matcher.is_match("Bob Johnson", "John Doe")[0])
         
+        # Symbol-only names have nothing left to compare after processing
+        self.assertFalse(self.matcher.is_match("🎉🎉", "✨✨")[0])
+        self.assertEqual(self.matcher.find_missing_attendees(["🎉🎉"], ["✨✨"]), ["✨✨"])
+        
     def test_threshold_effect(self):
         # Test that changing the threshold affects matching
         strict_matcher = NameMatcher(similarity_threshold=90)
@@ -66,6 +75,36 @@ class TestNameMatcher(unittest.TestCase):
         self.assertIsNone(best_match)
         self.assertLess(score, 80)
     
+    def test_tied_scores(self):
+        # Both attendees contain "john" and score 100
+        attendee_names = ["John Doe", "John Smith"]
+
+        # A single best match keeps the first attendee
+        self.assertEqual(self.matcher.find_best_match("john", attendee_names)[0][0], "John Doe")
+
+        # Top matches list tied attendees by name, descending, and the first of them is matched
+        matches = self.matcher.find_matches_for_discord_users(["john"], attendee_names)
+        self.assertEqual([name for name, _, _ in matches["john"]['top_matches']], ["John Smith", "John Doe"])
+        self.assertEqual(matches["john"]['match_name'], "John Smith")
+        self.assertEqual(self.matcher.find_missing_attendees(["john"], attendee_names), ["John Doe"])
+
+    def test_empty_attendee_name(self):
+        # An empty attendee name is always missing, with debug mode off and on
+        discord_users = ["", "jane"]
+        attendee_names = ["", "Jane"]
+        self.assertEqual(self.matcher.find_missing_attendees(discord_users, attendee_names), [""])
+        
+        # Debug mode writes its exports to the working directory, so run it in a temporary one
+        debug_matcher = NameMatcher(similarity_threshold=80, debug=True)
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+            os.chdir(temp_dir)
+            try:
+                missing = debug_matcher.find_missing_attendees(discord_users, attendee_names)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(missing, [""])
+    
     def test_find_missing_attendees(self):
         # Test finding missing attendees
         discord_users = ["john_doe", "jane.smith", "bob123"]
@@ -84,7 +123,7 @@ class TestNameMatcher(unittest.TestCase):
         discord_users = ["unknown1", "unknown2"]
         missing = self.matcher.find_missing_attendees(discord_users, attendee_names)
         self.assertEqual(len(missing), 4)
-        self.assertEqual(set(missing), set(attendee_names))
+        self.assertCountEqual(missing, attendee_names)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file